@@ -22,11 +22,12 @@ Drift sink: any state variable write.
 
 from __future__ import annotations
 
+import itertools
+from collections import deque
 from typing import TYPE_CHECKING
 
 from slither.core.cfg.node import NodeType
 from slither.core.declarations.solidity_variables import (
-    SolidityFunction,
     SolidityVariable,
     SolidityVariableComposed,
 )
@@ -37,15 +38,11 @@ from slither.detectors.abstract_detector import (
 )
 from slither.slithir.operations import (
     Assignment,
-    Binary,
     Condition,
-    Index,
     InternalCall,
     NewContract,
     SolidityCall,
     TypeConversion,
-    Unary,
-    Unpack,
 )
 from slither.slithir.operations.lvalue import OperationWithLValue
 from slither.slithir.variables import (
@@ -54,48 +51,92 @@ from slither.slithir.variables import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from slither.core.cfg.node import Node
     from slither.core.declarations import Contract, Function
     from slither.detectors.abstract_detector import DETECTOR_INFO
+    from slither.slithir.operations import Operation
 
 
 # ── helpers ──────────────────────────────────────────────────────
 
-_GASLEFT = SolidityFunction("gasleft()")
-_BALANCE = SolidityFunction("balance(address)")
 _MSG_SENDER = SolidityVariableComposed("msg.sender")
 
-# Gas-related composed variables treated as taint sources
-_GAS_COMPOSED_SOURCES: dict[SolidityVariableComposed, str] = {
-    SolidityVariableComposed("tx.gasprice"): "tx.gasprice",
-    SolidityVariableComposed("block.basefee"): "block.basefee",
-    SolidityVariableComposed("block.blobbasefee"): "block.blobbasefee",
-    SolidityVariableComposed("block.gaslimit"): "block.gaslimit",
-}
+# Slither creates a fresh object for every Solidity builtin it
+# meets, and their __eq__ compares class and name, so builtins are
+# matched by name string instead.
+
+# Gas-related composed variables treated as taint sources; the
+# name doubles as the reported reason.
+_GAS_COMPOSED_SOURCES = frozenset(
+    {
+        "tx.gasprice",
+        "block.basefee",
+        "block.blobbasefee",
+        "block.gaslimit",
+    }
+)
 
-_HASH_AND_ENCODE = {
-    SolidityFunction("keccak256()"),
-    SolidityFunction("keccak256(bytes)"),
-    SolidityFunction("sha3()"),
-    SolidityFunction("sha256()"),
-    SolidityFunction("sha256(bytes)"),
-    SolidityFunction("ripemd160()"),
-    SolidityFunction("ripemd160(bytes)"),
-    SolidityFunction("abi.encode()"),
-    SolidityFunction("abi.encodePacked()"),
-    SolidityFunction("abi.encodeWithSelector()"),
-    SolidityFunction("abi.encodeWithSignature()"),
-    SolidityFunction("abi.encodeCall()"),
-}
+
+def _is_msg_sender_ref(var: object) -> bool:
+    """Return True if *var* is msg.sender itself."""
+    return (
+        isinstance(var, SolidityVariableComposed) and var.name == "msg.sender"
+    )
+
+
+def _is_gas_source(var: object) -> bool:
+    """Return True if *var* is a gas-related composed variable."""
+    return (
+        isinstance(var, SolidityVariableComposed)
+        and var.name in _GAS_COMPOSED_SOURCES
+    )
 
 
-def _var_key(var: object) -> int | str:
-    """Stable identity for a variable across IR ops."""
+# Integer tokens identifying variables in taint sets.  State and
+# Solidity variables are interned by name so every object naming
+# the same variable shares a token.
+_TOKENS = itertools.count()
+_SHARED_TOKENS: dict[object, int] = {}
+
+
+def _shared_token(name: object) -> int:
+    token = _SHARED_TOKENS.get(name)
+    if token is None:
+        token = _SHARED_TOKENS[name] = next(_TOKENS)
+    return token
+
+
+def _var_key(var: object) -> int:
+    """Stable identity for a variable across IR ops.
+
+    The token is computed on first sight and cached on the
+    variable object, so repeated lookups are an attribute read.
+    """
+    try:
+        return var._sd_key
+    except AttributeError:
+        pass
     if isinstance(var, StateVariable):
-        return f"state:{var.canonical_name}"
-    if isinstance(var, (SolidityVariableComposed, SolidityVariable)):
-        return f"solidity:{var.name}"
-    return id(var)
+        key = _shared_token(f"state:{var.canonical_name}")
+    elif isinstance(var, (SolidityVariableComposed, SolidityVariable)):
+        key = _shared_token(f"solidity:{var.name}")
+    else:
+        key = next(_TOKENS)
+    try:
+        var._sd_key = key
+    except AttributeError:
+        # Objects without an instance dict (e.g. None) fall back
+        # to an identity-based token.
+        key = _shared_token(id(var))
+    return key
+
+
+def _func_key(func: Function) -> str:
+    return (
+        func.canonical_name if hasattr(func, "canonical_name") else str(func)
+    )
 
 
 def _resolve_ref(var: object) -> object:
@@ -109,185 +150,437 @@ def _resolve_ref(var: object) -> object:
     return var
 
 
+# ── IR index ─────────────────────────────────────────────────────
+
+# Kind tags assigned once per IR.  Every kind from _K_SOLIDITY_CALL
+# upwards is an OperationWithLValue; those without a dedicated tag
+# (Binary, Unary, Index, Unpack, ...) only need the generic
+# "any read tainted -> lvalue tainted" rule.
+_K_OTHER = 0
+_K_CONDITION = 1
+_K_SOLIDITY_CALL = 2
+_K_GASLEFT = 3
+_K_BALANCE = 4
+_K_NEW_CONTRACT = 5
+_K_CREATE2 = 6
+_K_ASSIGNMENT = 7
+_K_TYPE_CONVERSION = 8
+_K_INTERNAL_CALL = 9
+_K_LVALUE = 10
+
+# First matching class wins.
+_KIND_ORDER: tuple[tuple[type, int], ...] = (
+    (Condition, _K_CONDITION),
+    (SolidityCall, _K_SOLIDITY_CALL),
+    (NewContract, _K_NEW_CONTRACT),
+    (Assignment, _K_ASSIGNMENT),
+    (TypeConversion, _K_TYPE_CONVERSION),
+    (InternalCall, _K_INTERNAL_CALL),
+    (OperationWithLValue, _K_LVALUE),
+)
+
+
+# Solidity builtins with a dedicated kind, by name
+_SOLIDITY_CALL_KINDS: dict[str, int] = {
+    "gasleft()": _K_GASLEFT,
+    "balance(address)": _K_BALANCE,
+}
+
+
+def _ir_kind(ir: Operation) -> int:
+    for cls, kind in _KIND_ORDER:
+        if isinstance(ir, cls):
+            break
+    else:
+        return _K_OTHER
+    if kind == _K_SOLIDITY_CALL:
+        return _SOLIDITY_CALL_KINDS.get(ir.function.name, kind)
+    if kind == _K_NEW_CONTRACT and ir.call_salt is not None:
+        return _K_CREATE2
+    return kind
+
+
+class _NodeIR:
+    """IR of one CFG node as parallel per-IR tuples.
+
+    ``reads`` is the bitset of non-constant variables each IR
+    reads, ``lvalues`` the bit of its lvalue (0 if it has none),
+    ``targets`` the state variable it writes, if any, and
+    ``aliases`` the bit of the value it copies (assignments and
+    conversions), for msg.sender alias tracking, and ``gas`` the
+    bits of the gas-related composed variables it reads.  All are
+    derived from a single scan of each IR's reads; the names of
+    gas sources seen go into *reasons*.
+
+    A node is ``plain`` when none of its IRs is a taint source
+    or an internal call, so data flow is pure bitset arithmetic;
+    ``flow`` then holds (reads, lvalue, target, alias) for each IR
+    with an lvalue.
+    """
+
+    def __init__(self, node: Node, index: _IRIndex, reasons: set[str]) -> None:
+        self.node = node
+        self.irs = tuple(node.irs)
+        self.kinds = tuple(_ir_kind(ir) for ir in self.irs)
+        reads: list[int] = []
+        lvalues: list[int] = []
+        targets: list[StateVariable | None] = []
+        aliases: list[int] = []
+        gas: list[int] = []
+        plain = True
+        for kind, ir in zip(self.kinds, self.irs):
+            mask = 0
+            gas_mask = 0
+            for r in ir.read:
+                if r is not None and not isinstance(r, Constant):
+                    bit = index.bit(r)
+                    mask |= bit
+                    if isinstance(r, (StateVariable, SolidityVariable)):
+                        index.shared_reads[_var_key(r)] = bit
+                        if _is_gas_source(r):
+                            gas_mask |= bit
+                            reasons.add(r.name)
+            reads.append(mask)
+            gas.append(gas_mask)
+            if gas_mask:
+                plain = False
+            lvalue = ir.lvalue if kind >= _K_SOLIDITY_CALL else None
+            lbit = 0 if lvalue is None else index.bit(lvalue)
+            lvalues.append(lbit)
+            target = _resolve_ref(lvalue)
+            targets.append(
+                target if isinstance(target, StateVariable) else None
+            )
+            if kind == _K_ASSIGNMENT:
+                copied = ir.rvalue
+            elif kind == _K_TYPE_CONVERSION:
+                copied = ir.variable
+            else:
+                copied = None
+            if (
+                lbit
+                and copied is not None
+                and not isinstance(copied, Constant)
+            ):
+                aliases.append(index.bit(copied))
+            else:
+                aliases.append(0)
+            if kind in (_K_GASLEFT, _K_BALANCE, _K_CREATE2, _K_INTERNAL_CALL):
+                plain = False
+        self.reads = tuple(reads)
+        self.lvalues = tuple(lvalues)
+        self.targets = tuple(targets)
+        self.aliases = tuple(aliases)
+        self.gas = tuple(gas)
+        self.plain = plain
+        self.flow = tuple(
+            op
+            for op in zip(self.reads, self.lvalues, self.targets, self.aliases)
+            if op[1]
+        )
+
+
+class _IRIndex:
+    """IR of a function classified once, so analysis passes
+    dispatch on integer kinds and bitsets instead of re-walking
+    Slither objects.
+
+    ``nodes`` holds a _NodeIR per CFG node in order; the other
+    attributes summarize the whole function for interprocedural
+    passes.
+    """
+
+    def __init__(self, func: Function) -> None:
+        # variable token -> single-bit mask local to this function
+        self.bits: dict[int, int] = {}
+        # Union of the bits of state/Solidity variables, the only
+        # variables whose taint crosses function boundaries
+        self.shared_mask = 0
+        self.msg_sender_bit = self.bit(_MSG_SENDER)
+        # token -> bit of state/Solidity variables read in func
+        self.shared_reads: dict[int, int] = {}
+        self.internal_calls: list[InternalCall] = []
+        # Called functions with a body, for reason collection
+        self.callees: list[Function] = []
+        # (reads, bits to mark, written state var) per lvalue op
+        self.lvalue_flow: list[tuple[int, int, StateVariable | None]] = []
+        # Whether func's own body contains a taint source
+        self.introduces_taint = False
+        # id(if_node) -> (node, state vars written) for the body
+        # nodes that write state, filled lazily
+        self.branch_writes: dict[
+            int, list[tuple[Node, tuple[StateVariable, ...]]]
+        ] = {}
+        # id(node) -> nesting depth of IF/IFLOOP around it
+        self.branch_depth: dict[int, int] = {}
+        # (reads, state var token) of plain assignments to a state
+        # variable at branch depth 0, in execution order
+        self.unconditional_writes: list[tuple[int, int]] = []
+
+        reasons: set[str] = set()
+        self.nodes = [_NodeIR(node, self, reasons) for node in func.nodes]
+        has_msg_sender_ref = False
+        has_non_sender_balance = False
+        for nir in self.nodes:
+            if any(nir.gas):
+                self.introduces_taint = True
+            for kind, ir, reads, lbit, target in zip(
+                nir.kinds, nir.irs, nir.reads, nir.lvalues, nir.targets
+            ):
+                if lbit:
+                    marks = lbit | (self.bit(target) if target else 0)
+                    self.lvalue_flow.append((reads, marks, target))
+                if kind == _K_ASSIGNMENT:
+                    if _is_msg_sender_ref(ir.rvalue):
+                        has_msg_sender_ref = True
+                elif kind == _K_GASLEFT:
+                    reasons.add("gasleft()")
+                    self.introduces_taint = True
+                elif kind == _K_BALANCE and ir.arguments:
+                    if _is_msg_sender_ref(ir.arguments[0]):
+                        reasons.add("msg.sender.balance")
+                        self.introduces_taint = True
+                    else:
+                        has_non_sender_balance = True
+                elif kind == _K_CREATE2:
+                    reasons.add("CREATE2")
+                    self.introduces_taint = True
+                elif kind == _K_INTERNAL_CALL:
+                    self.internal_calls.append(ir)
+                    if ir.function and hasattr(ir.function, "nodes"):
+                        self.callees.append(ir.function)
+        # balance(x) where x is a local alias of msg.sender
+        if has_non_sender_balance:
+            if has_msg_sender_ref:
+                reasons.add("msg.sender.balance")
+            else:
+                reasons.add("address.balance")
+        self.local_reasons = frozenset(reasons)
+
+        # Depth 0 = unconditional (main execution path).
+        depth = 0
+        for nir in self.nodes:
+            node = nir.node
+            if node.type in (NodeType.IF, NodeType.IFLOOP):
+                self.branch_depth[id(node)] = depth
+                depth += 1
+            elif node.type is NodeType.ENDIF:
+                depth = max(depth - 1, 0)
+                self.branch_depth[id(node)] = depth
+            else:
+                self.branch_depth[id(node)] = depth
+            if self.branch_depth[id(node)] != 0:
+                continue
+            for kind, ir, reads, target in zip(
+                nir.kinds, nir.irs, nir.reads, nir.targets
+            ):
+                # Skip reference-based writes (mapping/array/struct)
+                # because writing to map[k1] doesn't overwrite map[k2]
+                if (
+                    kind == _K_ASSIGNMENT
+                    and target is not None
+                    and not isinstance(ir.lvalue, ReferenceVariable)
+                ):
+                    self.unconditional_writes.append((reads, _var_key(target)))
+
+    def bit(self, var: object) -> int:
+        """Return the taint-bitset mask for *var* in this function.
+
+        Bits are numbered per function so the bitsets stay small.
+        """
+        key = _var_key(var)
+        bit = self.bits.get(key)
+        if bit is None:
+            bit = self.bits[key] = 1 << len(self.bits)
+            if isinstance(var, (StateVariable, SolidityVariable)):
+                self.shared_mask |= bit
+        return bit
+
+    def branch_body_writes(
+        self, if_node: Node
+    ) -> list[tuple[Node, tuple[StateVariable, ...]]]:
+        """Return the state-writing body nodes of *if_node* with the
+        variables they write, walking the CFG only the first time."""
+        writes = self.branch_writes.get(id(if_node))
+        if writes is None:
+            writes = self.branch_writes[id(if_node)] = []
+            for bn in _collect_branch_body(if_node):
+                written = tuple(bn.state_variables_written)
+                if written:
+                    writes.append((bn, written))
+        return writes
+
+
+def _ir_index(func: Function) -> _IRIndex:
+    """Return the IR index of *func*, building it on first use.
+
+    Slither IR doesn't change during a detector run, so the index
+    is cached on the function object.
+    """
+    try:
+        return func._sd_ir_index
+    except AttributeError:
+        index = func._sd_ir_index = _IRIndex(func)
+        return index
+
+
 # ── per-function taint analysis ─────────────────────────────────
 
 
 class _FunctionTaintCtx:
-    """Taint context for a single function analysis pass."""
+    """Taint context for a single function analysis pass.
+
+    Taint and msg.sender aliases are bitsets over the bit numbering
+    of the function's IR index.
+    """
 
-    def __init__(self, function: Function) -> None:
+    def __init__(
+        self,
+        function: Function,
+        index: _IRIndex,
+        reasons_cache: dict[str, frozenset[str]],
+    ) -> None:
         self.function = function
-        self.tainted: set[int | str] = set()
-        # Variables known to alias msg.sender (by id)
-        self.msg_sender_aliases: set[int] = set()
+        self.index = index
+        self.bits = index.bits
+        self.bit = index.bit
+        self.reasons_cache = reasons_cache
+        self.tainted = 0
+        # msg.sender and the variables known to alias it
+        self.msg_sender_aliases = index.msg_sender_bit
         self.tainted_state_writes: list[tuple[StateVariable, Node, str]] = []
-        self._seen_writes: set[tuple[str, int]] = set()
-
-    def is_tainted(self, var: object) -> bool:
-        return _var_key(var) in self.tainted
+        # (state var token, id(node)) of recorded writes
+        self._seen_writes: set[tuple[int, int]] = set()
 
     def mark(self, var: object) -> None:
-        self.tainted.add(_var_key(var))
-
-    def mark_if_any_tainted(self, lvalue: object, reads: list[object]) -> None:
-        if any(self.is_tainted(r) for r in reads if r is not None):
-            if lvalue is not None:
-                self.mark(lvalue)
+        self.tainted |= self.bit(var)
 
     def is_msg_sender(self, var: object) -> bool:
         """Check if var is msg.sender or a local alias."""
-        if isinstance(var, SolidityVariableComposed):
-            return var == _MSG_SENDER
-        return id(var) in self.msg_sender_aliases
-
-    def mark_msg_sender_alias(self, var: object) -> None:
-        self.msg_sender_aliases.add(id(var))
+        return bool(self.msg_sender_aliases & self.bit(var))
 
 
 def _analyze_function(
     func: Function,
     call_taint_cache: dict[str, bool],
     callee_state_cache: dict[str, set[StateVariable]],
+    reasons_cache: dict[str, frozenset[str]],
 ) -> list[tuple[StateVariable, Node, str]]:
     """Run taint analysis on *func* and return tainted state writes.
 
     Returns list of (state_var, node, reason_string).
     """
-    ctx = _FunctionTaintCtx(func)
+    index = _ir_index(func)
+    ctx = _FunctionTaintCtx(func, index, reasons_cache)
 
     # Phase 1: forward data-flow taint on each node in order
-    for node in func.nodes:
+    for nir in index.nodes:
         _process_node_data_flow(
-            node, ctx, call_taint_cache, callee_state_cache
+            nir,
+            ctx,
+            call_taint_cache,
+            callee_state_cache,
+            reasons_cache,
         )
 
     # Phase 2: control-flow taint (branches with tainted conditions)
-    _propagate_control_flow_taint(func, ctx)
+    _propagate_control_flow_taint(index, ctx)
 
     # Phase 3: remove findings overwritten by a later clean write
-    _remove_overwritten_findings(func, ctx)
+    _remove_overwritten_findings(index, ctx)
 
     return ctx.tainted_state_writes
 
 
 def _process_node_data_flow(
-    node: Node,
+    nir: _NodeIR,
     ctx: _FunctionTaintCtx,
     call_taint_cache: dict[str, bool],
     callee_state_cache: dict[str, set[StateVariable]],
+    reasons_cache: dict[str, frozenset[str]],
 ) -> None:
-    """Propagate data-flow taint within a single CFG node."""
-    for ir in node.irs:
+    """Propagate data-flow taint within a single CFG node.
+
+    State writes are recorded in the same pass: every IR with an
+    lvalue is checked once its own propagation step is done.
+    """
+    if nir.plain:
+        # Fast path: bitset arithmetic over locals only
+        tainted = ctx.tainted
+        aliases = ctx.msg_sender_aliases
+        for reads, lbit, target, alias in nir.flow:
+            if alias & aliases:
+                aliases |= lbit
+            if reads & tainted:
+                tainted |= lbit
+            if target is not None and tainted & lbit:
+                _record_state_write(target, nir.node, ctx)
+        ctx.tainted = tainted
+        ctx.msg_sender_aliases = aliases
+        return
+
+    for kind, ir, reads, lbit, target, alias, gas in zip(
+        nir.kinds,
+        nir.irs,
+        nir.reads,
+        nir.lvalues,
+        nir.targets,
+        nir.aliases,
+        nir.gas,
+    ):
         # ── track msg.sender aliases ──
-        if isinstance(ir, Assignment):
-            if (
-                isinstance(ir.rvalue, SolidityVariableComposed)
-                and ir.rvalue == _MSG_SENDER
-            ):
-                ctx.mark_msg_sender_alias(ir.lvalue)
-            elif id(ir.rvalue) in ctx.msg_sender_aliases:
-                ctx.mark_msg_sender_alias(ir.lvalue)
+        if alias & ctx.msg_sender_aliases:
+            ctx.msg_sender_aliases |= lbit
 
         # ── gas-related composed variable sources ──
         # Mark the composed variable itself so downstream
         # propagation (assignments, binary ops, etc.) sees it.
-        for r in ir.read:
-            if (
-                isinstance(r, SolidityVariableComposed)
-                and r in _GAS_COMPOSED_SOURCES
-            ):
-                ctx.mark(r)
+        ctx.tainted |= gas
 
         # ── taint sources ──
-        if isinstance(ir, SolidityCall):
-            if ir.function == _GASLEFT and ir.lvalue is not None:
-                ctx.mark(ir.lvalue)
-                continue
-            if ir.function == _BALANCE and ir.lvalue is not None:
-                args = ir.arguments
-                if args and ctx.is_msg_sender(args[0]):
-                    ctx.mark(ir.lvalue)
-                    continue
-            # Hash / abi-encode: propagate taint from args
-            if ir.function in _HASH_AND_ENCODE:
-                if ir.lvalue is not None:
-                    ctx.mark_if_any_tainted(ir.lvalue, ir.arguments)
-                continue
+        if kind == _K_GASLEFT or kind == _K_CREATE2:
+            ctx.tainted |= lbit
 
-        if isinstance(ir, NewContract):
-            if ir.call_salt is not None and ir.lvalue is not None:
-                ctx.mark(ir.lvalue)
-                continue
+        elif (
+            kind == _K_BALANCE
+            and ir.arguments
+            and ctx.is_msg_sender(ir.arguments[0])
+        ):
+            ctx.tainted |= lbit
 
         # ── taint propagation ──
-        if isinstance(ir, Assignment):
-            if ctx.is_tainted(ir.rvalue):
-                ctx.mark(ir.lvalue)
-                _maybe_record_state_write(ir.lvalue, node, ctx)
-            continue
-
-        if isinstance(ir, Binary):
-            ctx.mark_if_any_tainted(
-                ir.lvalue, [ir.variable_left, ir.variable_right]
-            )
-            continue
-
-        if isinstance(ir, Unary):
-            if hasattr(ir, "rvalue") and ctx.is_tainted(ir.rvalue):
-                if ir.lvalue is not None:
-                    ctx.mark(ir.lvalue)
-            continue
-
-        if isinstance(ir, TypeConversion):
-            if ctx.is_tainted(ir.variable):
-                if ir.lvalue is not None:
-                    ctx.mark(ir.lvalue)
-            if ctx.is_msg_sender(ir.variable):
-                if ir.lvalue is not None:
-                    ctx.mark_msg_sender_alias(ir.lvalue)
-            continue
-
-        if isinstance(ir, Index):
-            tainted_key = ctx.is_tainted(ir.variable_right)
-            tainted_arr = ctx.is_tainted(ir.variable_left)
-            if tainted_key or tainted_arr:
-                if ir.lvalue is not None:
-                    ctx.mark(ir.lvalue)
-            continue
-
-        if isinstance(ir, Unpack):
-            if ctx.is_tainted(ir.tuple):
-                if ir.lvalue is not None:
-                    ctx.mark(ir.lvalue)
-            continue
-
-        if isinstance(ir, InternalCall):
+        elif kind == _K_INTERNAL_CALL:
             _handle_internal_call(
                 ir,
-                node,
+                reads,
+                lbit,
                 ctx,
                 call_taint_cache,
                 callee_state_cache,
+                reasons_cache,
             )
-            continue
 
         # Generic: any operation with lvalue that reads tainted
-        if isinstance(ir, OperationWithLValue) and ir.lvalue:
-            reads = [v for v in ir.read if not isinstance(v, Constant)]
-            ctx.mark_if_any_tainted(ir.lvalue, reads)
+        # (assignments, arithmetic, hashing, indexing, ...).  For
+        # hash calls ir.read is ir.arguments unrolled; the only nested
+        # argument lists SlithIR builds are abi.decode type tuples,
+        # which hold no variables, so both give the same result.
+        elif reads & ctx.tainted:
+            ctx.tainted |= lbit
 
-    # After processing all IRs, check for state writes
-    for ir in node.irs:
-        if isinstance(ir, OperationWithLValue) and ir.lvalue:
-            _maybe_record_state_write(ir.lvalue, node, ctx)
+        # ── state write check ──
+        if target is not None and ctx.tainted & lbit:
+            _record_state_write(target, nir.node, ctx)
 
 
 def _handle_internal_call(
     ir: InternalCall,
-    node: Node,
+    reads: int,
+    lbit: int,
     ctx: _FunctionTaintCtx,
     call_taint_cache: dict[str, bool],
     callee_state_cache: dict[str, set[StateVariable]],
+    reasons_cache: dict[str, frozenset[str]],
 ) -> None:
     """Propagate taint through internal function calls.
 
@@ -300,9 +593,7 @@ def _handle_internal_call(
     if callee is None or not hasattr(callee, "nodes"):
         return
 
-    any_arg_tainted = any(
-        ctx.is_tainted(a) for a in ir.arguments if not isinstance(a, Constant)
-    )
+    any_arg_tainted = reads & ctx.tainted
 
     callee_key = callee.canonical_name
     if callee_key not in call_taint_cache:
@@ -310,12 +601,12 @@ def _handle_internal_call(
 
     callee_has_taint = call_taint_cache[callee_key]
 
-    if (any_arg_tainted or callee_has_taint) and ir.lvalue:
-        ctx.mark(ir.lvalue)
+    if any_arg_tainted or callee_has_taint:
+        ctx.tainted |= lbit
 
     # Propagate side effects: state variables tainted by callee
     tainted_state = _callee_tainted_state_vars(
-        callee, call_taint_cache, callee_state_cache
+        callee, call_taint_cache, callee_state_cache, reasons_cache
     )
     for sv in tainted_state:
         ctx.mark(sv)
@@ -336,51 +627,39 @@ def _propagate_caller_taint_through_callee(
     taintedVar in ctx. _copy() reads taintedVar and writes
     copiedVar. This function propagates that chain.
     """
-    local_taint: set[int | str] = set()
-    for node in callee.nodes:
-        for ir in node.irs:
-            if not (
-                isinstance(ir, OperationWithLValue) and ir.lvalue is not None
-            ):
-                continue
-            reads = [v for v in ir.read if not isinstance(v, Constant)]
-            if any(
-                ctx.is_tainted(r) or _var_key(r) in local_taint for r in reads
-            ):
-                local_taint.add(_var_key(ir.lvalue))
-                target = _resolve_ref(ir.lvalue)
-                if isinstance(target, StateVariable):
-                    ctx.mark(target)
+    index = _ir_index(callee)
+    # Caller taint in the callee's bit numbering.  Only state and
+    # Solidity variables are shared between the two functions,
+    # unless the call is recursive.
+    if index.bits is ctx.bits:
+        local_taint = ctx.tainted
+    elif not ctx.tainted & ctx.index.shared_mask:
+        # Nothing tainted that the callee could read
+        return
+    else:
+        local_taint = 0
+        for key, bit in index.shared_reads.items():
+            if ctx.tainted & ctx.bits.get(key, 0):
+                local_taint |= bit
+        if not local_taint:
+            return
+    for reads, marks, target in index.lvalue_flow:
+        if reads & local_taint:
+            local_taint |= marks
+            if target is not None:
+                ctx.mark(target)
 
 
 def _callee_introduces_taint(func: Function) -> bool:
     """Return True if the function body contains taint sources."""
-    for node in func.nodes:
-        for ir in node.irs:
-            if isinstance(ir, SolidityCall):
-                if ir.function == _GASLEFT:
-                    return True
-                if ir.function == _BALANCE:
-                    args = ir.arguments
-                    if args and isinstance(args[0], SolidityVariableComposed):
-                        if args[0] == _MSG_SENDER:
-                            return True
-            if isinstance(ir, NewContract):
-                if ir.call_salt is not None:
-                    return True
-            for r in ir.read:
-                if (
-                    isinstance(r, SolidityVariableComposed)
-                    and r in _GAS_COMPOSED_SOURCES
-                ):
-                    return True
-    return False
+    return _ir_index(func).introduces_taint
 
 
 def _callee_tainted_state_vars(
     func: Function,
     call_taint_cache: dict[str, bool],
     callee_state_cache: dict[str, set[StateVariable]],
+    reasons_cache: dict[str, frozenset[str]],
 ) -> set[StateVariable]:
     """Analyze callee to find state variables it taints.
 
@@ -399,113 +678,188 @@ def _callee_tainted_state_vars(
     if func.contract_declarer is None:
         return set()
 
-    writes = _analyze_function(func, call_taint_cache, callee_state_cache)
+    writes = _analyze_function(
+        func, call_taint_cache, callee_state_cache, reasons_cache
+    )
     result = {sv for sv, _node, _reason in writes}
     callee_state_cache[key] = result
     return result
 
 
-def _maybe_record_state_write(
-    lvalue: object,
+# ── call-graph fixpoint ──────────────────────────────────────────
+
+
+def _internal_callees(func: Function) -> list[Function]:
+    """Return the distinct contract functions *func* calls."""
+    callees: dict[str, Function] = {}
+    for ir in _ir_index(func).internal_calls:
+        callee = ir.function
+        if getattr(callee, "contract_declarer", None) is not None:
+            callees.setdefault(callee.canonical_name, callee)
+    return list(callees.values())
+
+
+def _call_graph_sccs(roots: list[Function]) -> list[list[Function]]:
+    """Return the strongly connected components of the internal
+    call graph reachable from *roots*, callees before callers.
+
+    Iterative Tarjan; functions are identified by canonical name,
+    matching the callee caches.
+    """
+    order: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[Function] = []
+    sccs: list[list[Function]] = []
+    # DFS frames: (function, iterator over its remaining callees)
+    work: list[tuple[Function, Iterator[Function]]] = []
+
+    def visit(func: Function) -> None:
+        key = func.canonical_name
+        order[key] = lowlink[key] = len(order)
+        stack.append(func)
+        on_stack.add(key)
+        work.append((func, iter(_internal_callees(func))))
+
+    for root in roots:
+        if root.canonical_name in order:
+            continue
+        visit(root)
+        while work:
+            func, callees = work[-1]
+            key = func.canonical_name
+            for callee in callees:
+                callee_key = callee.canonical_name
+                if callee_key not in order:
+                    visit(callee)
+                    break
+                if callee_key in on_stack:
+                    lowlink[key] = min(lowlink[key], order[callee_key])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0].canonical_name
+                    lowlink[parent] = min(lowlink[parent], lowlink[key])
+                if lowlink[key] == order[key]:
+                    scc: list[Function] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member.canonical_name)
+                        scc.append(member)
+                        if member is func:
+                            break
+                    sccs.append(scc)
+    return sccs
+
+
+def _analyze_call_graph(
+    roots: list[Function],
+    call_taint_cache: dict[str, bool],
+    callee_state_cache: dict[str, set[StateVariable]],
+    reasons_cache: dict[str, frozenset[str]],
+) -> dict[int, list[tuple[StateVariable, Node, str]]]:
+    """Analyze *roots* and all functions they call, callees first.
+
+    Members of a recursive component are re-analyzed until their
+    tainted state sets stop changing, so every call sees a
+    converged callee summary instead of the empty placeholder a
+    recursive lookup would get.  Returns the writes of each
+    analyzed function, keyed by id().
+    """
+    writes_by_func: dict[int, list[tuple[StateVariable, Node, str]]] = {}
+    for scc in _call_graph_sccs(roots):
+        head = scc[0].canonical_name
+        recursive = len(scc) > 1 or any(
+            callee.canonical_name == head
+            for callee in _internal_callees(scc[0])
+        )
+        for func in scc:
+            callee_state_cache.setdefault(func.canonical_name, set())
+        while True:
+            changed = False
+            for func in scc:
+                writes = _analyze_function(
+                    func, call_taint_cache, callee_state_cache, reasons_cache
+                )
+                writes_by_func[id(func)] = writes
+                result = {sv for sv, _node, _reason in writes}
+                if result != callee_state_cache[func.canonical_name]:
+                    callee_state_cache[func.canonical_name] = result
+                    changed = True
+            if not (recursive and changed):
+                break
+    return writes_by_func
+
+
+def _record_state_write(
+    state_var: StateVariable,
     node: Node,
     ctx: _FunctionTaintCtx,
 ) -> None:
-    """If lvalue resolves to a state variable and is tainted."""
-    target = _resolve_ref(lvalue)
-    if isinstance(target, StateVariable) and ctx.is_tainted(lvalue):
-        key = (target.canonical_name, id(node))
-        if key not in ctx._seen_writes:
-            reason = _infer_reason(ctx)
-            ctx._seen_writes.add(key)
-            ctx.tainted_state_writes.append((target, node, reason))
+    """Record a tainted write to *state_var* at *node*, once."""
+    key = (_var_key(state_var), id(node))
+    if key not in ctx._seen_writes:
+        reason = _infer_reason(ctx)
+        ctx._seen_writes.add(key)
+        ctx.tainted_state_writes.append((state_var, node, reason))
 
 
 def _infer_reason(ctx: _FunctionTaintCtx) -> str:
     """Infer which taint source caused the write.
 
     Result is cached per ctx since the function body is constant.
+    The underlying reason set is also shared across contexts via
+    ``ctx.reasons_cache``.
     """
     if not hasattr(ctx, "_cached_reason"):
-        reasons: set[str] = set()
-        _collect_reasons(ctx.function, reasons, set())
-        ordered = sorted(reasons)
+        ordered = sorted(_function_reasons(ctx.function, ctx.reasons_cache))
         ctx._cached_reason = (
             ", ".join(ordered) if ordered else "tainted source"
         )
     return ctx._cached_reason
 
 
-def _collect_reasons(
+def _function_reasons(
     func: Function,
-    reasons: set[str],
-    visited: set[str],
-) -> None:
-    """Recursively collect taint source names from a function."""
-    key = func.canonical_name if hasattr(func, "canonical_name") else str(func)
-    if key in visited:
-        return
-    visited.add(key)
+    reasons_cache: dict[str, frozenset[str]],
+) -> frozenset[str]:
+    """Return the taint source names reachable from *func*.
 
-    has_msg_sender_ref = False
-    has_non_sender_balance = False
-    callees: list[Function] = []
-
-    for n in func.nodes:
-        for ir in n.irs:
-            # Track msg.sender references
-            if isinstance(ir, Assignment):
-                if (
-                    isinstance(ir.rvalue, SolidityVariableComposed)
-                    and ir.rvalue == _MSG_SENDER
-                ):
-                    has_msg_sender_ref = True
-
-            # Gas-related composed variables
-            for r in ir.read:
-                if (
-                    isinstance(r, SolidityVariableComposed)
-                    and r in _GAS_COMPOSED_SOURCES
-                ):
-                    reasons.add(_GAS_COMPOSED_SOURCES[r])
-
-            if isinstance(ir, SolidityCall):
-                if ir.function == _GASLEFT:
-                    reasons.add("gasleft()")
-                if ir.function == _BALANCE:
-                    args = ir.arguments
-                    if (
-                        args
-                        and isinstance(args[0], SolidityVariableComposed)
-                        and args[0] == _MSG_SENDER
-                    ):
-                        reasons.add("msg.sender.balance")
-                    elif args:
-                        has_non_sender_balance = True
-
-            if isinstance(ir, NewContract) and ir.call_salt is not None:
-                reasons.add("CREATE2")
-
-            if isinstance(ir, InternalCall) and ir.function:
-                callee = ir.function
-                if hasattr(callee, "nodes"):
-                    callees.append(callee)
-
-    # balance(x) where x is a local alias of msg.sender
-    if has_non_sender_balance:
-        if has_msg_sender_ref:
-            reasons.add("msg.sender.balance")
-        else:
-            reasons.add("address.balance")
+    Merges the local reasons of the IR index over all transitive
+    callees, breadth first.  Callees whose full reason set is
+    already in *reasons_cache* are merged without being walked.
+    """
+    key = _func_key(func)
+    reasons = reasons_cache.get(key)
+    if reasons is not None:
+        return reasons
+
+    collected: set[str] = set()
+    visited = {key}
+    queue = deque([func])
+    while queue:
+        index = _ir_index(queue.popleft())
+        collected |= index.local_reasons
+        for callee in index.callees:
+            callee_key = _func_key(callee)
+            if callee_key in visited:
+                continue
+            visited.add(callee_key)
+            cached = reasons_cache.get(callee_key)
+            if cached is not None:
+                collected |= cached
+            else:
+                queue.append(callee)
 
-    for callee in callees:
-        _collect_reasons(callee, reasons, visited)
+    reasons = reasons_cache[key] = frozenset(collected)
+    return reasons
 
 
 # ── overwrite elimination ────────────────────────────────────────
 
 
 def _remove_overwritten_findings(
-    func: Function,
+    index: _IRIndex,
     ctx: _FunctionTaintCtx,
 ) -> None:
     """Remove findings for state vars unconditionally overwritten
@@ -518,64 +872,24 @@ def _remove_overwritten_findings(
     if not ctx.tainted_state_writes:
         return
 
-    # Compute branch depth for each node.
-    # Depth 0 = unconditional (main execution path).
-    branch_depth: dict[int, int] = {}
-    depth = 0
-    for node in func.nodes:
-        if node.type in (NodeType.IF, NodeType.IFLOOP):
-            branch_depth[id(node)] = depth
-            depth += 1
-        elif node.type is NodeType.ENDIF:
-            depth = max(depth - 1, 0)
-            branch_depth[id(node)] = depth
-        else:
-            branch_depth[id(node)] = depth
-
-    node_order = {id(n): i for i, n in enumerate(func.nodes)}
-
-    # Collect unconditional state-variable assignments
-    # (node_index, is_rvalue_tainted)
-    writes: dict[str, list[tuple[int, bool]]] = {}
-    for node in func.nodes:
-        if branch_depth.get(id(node), 0) != 0:
-            continue
-        idx = node_order.get(id(node), -1)
-        for ir in node.irs:
-            if not isinstance(ir, Assignment):
-                continue
-            if ir.lvalue is None:
-                continue
-            # Skip reference-based writes (mapping/array/struct)
-            # because writing to map[k1] doesn't overwrite map[k2]
-            if isinstance(ir.lvalue, ReferenceVariable):
-                continue
-            target = _resolve_ref(ir.lvalue)
-            if not isinstance(target, StateVariable):
-                continue
-            is_tainted = ctx.is_tainted(ir.rvalue)
-            cname = target.canonical_name
-            if cname not in writes:
-                writes[cname] = []
-            writes[cname].append((idx, is_tainted))
-
-    to_remove: set[str] = set()
-    for cname, write_list in writes.items():
-        if not write_list:
-            continue
-        write_list.sort(key=lambda x: x[0])
-        _last_idx, last_tainted = write_list[-1]
-        if not last_tainted:
-            to_remove.add(cname)
+    # Whether the last unconditional write to each variable is
+    # tainted; later writes overwrite earlier entries.
+    last_tainted: dict[int, bool] = {}
+    for reads, token in index.unconditional_writes:
+        last_tainted[token] = bool(reads & ctx.tainted)
+
+    to_remove = {
+        token for token, tainted in last_tainted.items() if not tainted
+    }
 
     if to_remove:
         ctx.tainted_state_writes = [
             (sv, n, r)
             for sv, n, r in ctx.tainted_state_writes
-            if sv.canonical_name not in to_remove
+            if _var_key(sv) not in to_remove
         ]
         ctx._seen_writes = {
-            (sv.canonical_name, id(n)) for sv, n, _ in ctx.tainted_state_writes
+            (_var_key(sv), id(n)) for sv, n, _ in ctx.tainted_state_writes
         }
 
 
@@ -583,57 +897,54 @@ def _remove_overwritten_findings(
 
 
 def _propagate_control_flow_taint(
-    func: Function,
+    index: _IRIndex,
     ctx: _FunctionTaintCtx,
 ) -> None:
     """If a branch condition is tainted, all state writes in that
     branch body are considered tainted."""
-    for node in func.nodes:
-        if node.type not in (NodeType.IF, NodeType.IFLOOP):
+    for nir in index.nodes:
+        if nir.node.type not in (NodeType.IF, NodeType.IFLOOP):
             continue
         cond_tainted = False
-        for ir in node.irs:
-            if isinstance(ir, Condition):
-                if ctx.is_tainted(ir.value):
+        for kind, reads, lbit in zip(nir.kinds, nir.reads, nir.lvalues):
+            if kind == _K_CONDITION:
+                if reads & ctx.tainted:
                     cond_tainted = True
-            if isinstance(ir, OperationWithLValue):
-                reads = [v for v in ir.read if not isinstance(v, Constant)]
-                if any(ctx.is_tainted(r) for r in reads):
-                    if ir.lvalue is not None:
-                        ctx.mark(ir.lvalue)
+            elif kind >= _K_SOLIDITY_CALL:
+                if reads & ctx.tainted:
+                    ctx.tainted |= lbit
 
         if not cond_tainted:
             continue
 
-        branch_nodes = _collect_branch_body(node)
-        for bn in branch_nodes:
-            for sv in bn.state_variables_written:
-                key = (sv.canonical_name, id(bn))
-                if key not in ctx._seen_writes:
-                    reason = _infer_reason(ctx)
-                    ctx._seen_writes.add(key)
-                    ctx.tainted_state_writes.append((sv, bn, reason))
+        for bn, written in index.branch_body_writes(nir.node):
+            for sv in written:
+                _record_state_write(sv, bn, ctx)
 
 
 def _collect_branch_body(if_node: Node) -> list[Node]:
     """Collect nodes in the body of an if-branch.
 
     Walk from if_node's sons until we hit the ENDIF merge node.
+    Nodes are marked visited when pushed, so join points in the
+    CFG are enqueued only once.
     """
     result: list[Node] = []
     visited: set[int] = {id(if_node)}
-    worklist: list[Node] = list(if_node.sons)
+    worklist: list[Node] = []
+    for son in if_node.sons:
+        if id(son) not in visited:
+            visited.add(id(son))
+            worklist.append(son)
 
     while worklist:
         current = worklist.pop()
-        if id(current) in visited:
-            continue
-        visited.add(id(current))
         if current.type is NodeType.ENDIF:
             continue
         result.append(current)
         for son in current.sons:
             if id(son) not in visited:
+                visited.add(id(son))
                 worklist.append(son)
     return result
 
@@ -700,33 +1011,55 @@ can be manipulated by callers to influence contract state."""
         results = []
         call_taint_cache: dict[str, bool] = {}
         callee_state_cache: dict[str, set[StateVariable]] = {}
-        seen: set[tuple[str, str]] = set()
+        reasons_cache: dict[str, frozenset[str]] = {}
+        # function canonical name -> tokens of variables reported
+        seen: dict[str, set[int]] = {}
 
+        per_contract = []
         for contract in self.compilation_unit.contracts_derived:
             # Analyze both functions and modifiers
             analyzable = list(contract.functions_declared) + list(
                 contract.modifiers_declared
             )
             # Include inherited modifiers not declared locally
+            analyzable_ids = {id(f) for f in analyzable}
             for mod in contract.modifiers:
-                if mod not in analyzable:
+                if id(mod) not in analyzable_ids:
                     analyzable.append(mod)
-            for func in analyzable:
-                if not func.is_implemented:
-                    continue
-                writes = _analyze_function(
-                    func,
-                    call_taint_cache,
-                    callee_state_cache,
-                )
-                for state_var, node, reason in writes:
-                    key = (
-                        state_var.canonical_name,
-                        func.canonical_name,
+                    analyzable_ids.add(id(mod))
+            per_contract.append(
+                (contract, [f for f in analyzable if f.is_implemented])
+            )
+
+        # Solve callee summaries over the whole call graph first.
+        # This stays in-process: Slither's IR objects can't be
+        # pickled to worker processes, and the shared callee caches
+        # make later components depend on earlier ones anyway.
+        writes_by_func = _analyze_call_graph(
+            [func for _contract, funcs in per_contract for func in funcs],
+            call_taint_cache,
+            callee_state_cache,
+            reasons_cache,
+        )
+
+        for contract, funcs in per_contract:
+            for func in funcs:
+                writes = writes_by_func.get(id(func))
+                if writes is None:
+                    # Same canonical name as an already-solved
+                    # function (e.g. an inherited modifier)
+                    writes = _analyze_function(
+                        func,
+                        call_taint_cache,
+                        callee_state_cache,
+                        reasons_cache,
                     )
-                    if key in seen:
+                reported = seen.setdefault(func.canonical_name, set())
+                for state_var, node, reason in writes:
+                    token = _var_key(state_var)
+                    if token in reported:
                         continue
-                    seen.add(key)
+                    reported.add(token)
 
                     slot, offset = _get_storage_slot(
                         contract,
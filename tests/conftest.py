@@ -0,0 +1,90 @@
+"""Shared pytest fixtures for the storage-drift tests."""
+
+from __future__ import annotations
+
+import pytest
+from helpers import (
+    analyze,
+    clear_caches,
+    find_solc,
+    run_detector,
+    set_disk_cache,
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-slither-cache",
+        action="store_true",
+        help="re-run Slither instead of reading tests/.drift_cache",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--no-slither-cache"):
+        set_disk_cache(False)
+
+
+def pytest_collection_modifyitems(items):
+    """Pin tests that share a contract to one xdist worker.
+
+    Tests marked ``sol_file`` are grouped by that contract, the rest
+    by their class or module, so each worker analyzes a contract at
+    most once under ``--dist=loadgroup``.
+    """
+    for item in items:
+        marker = item.get_closest_marker("sol_file")
+        group = marker.args[0] if marker else item.parent.nodeid
+        item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+@pytest.fixture(scope="session")
+def detector_runner():
+    """analyze, shared by the whole session.
+
+    Call as ``detector_runner(filename, solc=None)``; returns the
+    contract's Analyzed results, memoized by analyze itself.  Every
+    in-memory result cache is dropped when the session ends.
+    """
+    yield analyze
+    clear_caches()
+
+
+@pytest.fixture(scope="session")
+def detector_results(detector_runner):
+    """Raw detector results, computed once per contract per session.
+
+    Call as ``detector_results(filename)``.
+    """
+
+    def _get(filename: str) -> tuple[dict, ...]:
+        return detector_runner(filename).raw
+
+    return _get
+
+
+# ── real-contract results ─────────────────────────────────────
+
+
+@pytest.fixture(scope="session")
+def tether_results():
+    return run_detector("tokens/tether.sol")
+
+
+@pytest.fixture(scope="session")
+def weth_results():
+    return run_detector("tokens/weth.sol")
+
+
+@pytest.fixture(scope="session")
+def uniswap_factory_results():
+    return run_detector(
+        "uniswap-v3/UniswapV3Factory.sol", solc=find_solc("0.7.6")
+    )
+
+
+@pytest.fixture(scope="session")
+def uniswap_pool_results():
+    return run_detector(
+        "uniswap-v3/UniswapV3Pool.sol", solc=find_solc("0.7.6")
+    )
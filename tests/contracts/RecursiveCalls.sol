@@ -0,0 +1,64 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+/// Tests for taint summaries of recursive internal calls.
+/// _ping() and _pong() call each other and each copies a variable
+/// the other one taints, so a caller only sees the full set of
+/// tainted writes once the recursive summaries have converged.
+contract RecursiveCalls {
+    uint256 public gasA;          // TAINTED: gasleft in _pong() base case
+    uint256 public gasB;          // TAINTED: gasleft in _ping() base case
+    uint256 public copiedA;       // TAINTED: _ping() reads gasA after _pong()
+    uint256 public copiedB;       // TAINTED: _pong() reads gasB after _ping()
+    uint256 public mirrorA;       // TAINTED: reads copiedA after _ping()
+    uint256 public mirrorB;       // TAINTED: reads copiedB after _pong()
+    uint256 public selfGas;       // TAINTED: gasleft in _countdown() base case
+    uint256 public selfCopy;      // TAINTED: _countdown() reads selfGas after recursing
+    uint256 public selfMirror;    // TAINTED: reads selfCopy after _countdown()
+    uint256 public calls;         // CLEAN: plain counter inside the recursion
+
+    function _ping(uint256 n) internal {
+        if (n == 0) {
+            gasB = gasleft();
+            return;
+        }
+        _pong(n - 1);
+        copiedA = gasA;
+        calls += 1;
+    }
+
+    function _pong(uint256 n) internal {
+        if (n == 0) {
+            gasA = gasleft();
+            return;
+        }
+        _ping(n - 1);
+        copiedB = gasB;
+    }
+
+    /// Self recursion: the copy is read before the base case in
+    /// source order
+    function _countdown(uint256 n) internal {
+        if (n > 0) {
+            _countdown(n - 1);
+            selfCopy = selfGas;
+        } else {
+            selfGas = gasleft();
+        }
+    }
+
+    function runPing(uint256 n) external {
+        _ping(n);
+        mirrorA = copiedA;
+    }
+
+    function runPong(uint256 n) external {
+        _pong(n);
+        mirrorB = copiedB;
+    }
+
+    function runSelf(uint256 n) external {
+        _countdown(n);
+        selfMirror = selfCopy;
+    }
+}
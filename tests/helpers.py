@@ -2,69 +2,281 @@
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
+import os
+import re
+import subprocess
+import tempfile
+from importlib.metadata import version
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Sequence
 
-from slither import Slither
-
-from storage_drift.detectors.drift_detector import (
-    StorageDrift,
-)
+# Slither and the detector are imported where a contract is first
+# analyzed, so collecting or deselecting tests doesn't pay for them.
 
 CONTRACTS_DIR = Path(__file__).parent / "contracts"
+CACHE_DIR = Path(__file__).parent / ".drift_cache"
+# A storage_drift "slot_hex": 0x plus 64 lowercase hex digits.
+SLOT_HEX = re.compile(r"0x[0-9a-f]{64}")
+# Switched off by the --no-slither-cache pytest option.
+_disk_cache = True
 
 # ── result cache ──────────────────────────────────────────────
 
-_cache: dict[tuple[str, str | None], list[dict]] = {}
+
+class Analyzed(NamedTuple):
+    """Detector results of one contract with their derived views."""
+
+    raw: tuple[dict, ...]
+    drifting: frozenset[str]
+    fields: Mapping[str, dict]
+
+
+_cache: dict[tuple[str, str | None], Analyzed] = {}
+# filename -> contract path under CONTRACTS_DIR
+_paths: dict[str, Path] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _solc_identity(solc: str | None) -> str:
+    """Name the compiler Slither will use for *solc*.
+
+    The explicit binary if given, else SOLC_VERSION, else the
+    version solc-select has selected, else ``solc --version``.
+    """
+    if solc:
+        return solc
+    env = os.environ.get("SOLC_VERSION")
+    if env:
+        return env
+    try:
+        from solc_select.solc_select import current_version
+
+        return current_version()[0]
+    except (ImportError, argparse.ArgumentTypeError):
+        # not installed, or no installed version selected
+        pass
+    try:
+        return subprocess.run(
+            ["solc", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return ""
 
 
-def run_detector(filename: str, *, solc: str | None = None) -> list[dict]:
-    """Run storage-drift on a contract and return JSON results.
+def _cache_key(sol_path: Path, solc: str | None) -> str:
+    """Hash everything the detector output depends on.
+
+    Covers the detector source, the Slither and crytic-compile
+    versions, the compiler actually used and every .sol file next
+    to the contract, so that edits to imported files invalidate
+    the entry too.
+    """
+    from storage_drift.detectors import drift_detector
+
+    h = hashlib.sha256()
+    h.update(Path(drift_detector.__file__).read_bytes())
+    for part in (
+        version("slither-analyzer"),
+        version("crytic-compile"),
+        _solc_identity(solc),
+        sol_path.name,
+    ):
+        h.update(b"\0" + part.encode())
+    for path in sorted(sol_path.parent.rglob("*.sol")):
+        h.update(b"\0" + path.relative_to(sol_path.parent).as_posix().encode())
+        h.update(b"\0" + path.read_bytes())
+    return h.hexdigest()
+
+
+def _load_cached(cache_file: Path) -> list[dict] | None:
+    """Return results stored in *cache_file*, or None.
+
+    A missing, unreadable or corrupt entry counts as a miss.
+    """
+    try:
+        results = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    return results if isinstance(results, list) else None
+
+
+def _store_cached(cache_file: Path, results: Sequence[dict]) -> None:
+    """Atomically write *results* to *cache_file*.
+
+    The entry is written to a temporary file and renamed into
+    place, so concurrent xdist workers never read a partial entry.
+    Failures only cost a rerun.
+    """
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=CACHE_DIR, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            json.dump(results, tmp)
+        os.replace(tmp_name, cache_file)
+    except (OSError, TypeError, ValueError):
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
+def set_disk_cache(enabled: bool) -> None:
+    """Enable or disable the on-disk result cache."""
+    global _disk_cache
+    _disk_cache = enabled
+
+
+def analyze(filename: str, *, solc: str | None = None) -> Analyzed:
+    """Run storage-drift on a contract and return its Analyzed.
 
     Results are cached by (filename, solc) so the same contract
-    is compiled at most once per test session.
+    is compiled at most once per test session, and on disk under
+    tests/.drift_cache so later sessions skip compilation while
+    the inputs are unchanged, unless set_disk_cache(False) was
+    called.  The derived views are built once, right after the
+    run.  The results are a tuple so that no caller can alter
+    what later callers see.
     """
     key = (filename, solc)
     if key not in _cache:
-        sol_path = str(CONTRACTS_DIR / filename)
-        kwargs: dict = {}
-        if solc is not None:
-            kwargs["solc"] = solc
-        sl = Slither(sol_path, **kwargs)
-        sl.register_detector(StorageDrift)
-        results = sl.run_detectors()
-        _cache[key] = [item for sublist in results for item in sublist]
+        sol_path = _paths.get(filename)
+        if sol_path is None:
+            sol_path = _paths[filename] = CONTRACTS_DIR / filename
+        cache_file = None
+        loaded = None
+        if _disk_cache:
+            cache_file = CACHE_DIR / f"{_cache_key(sol_path, solc)}.json"
+            loaded = _load_cached(cache_file)
+        if loaded is not None:
+            results = tuple(loaded)
+        else:
+            from slither import Slither
+
+            from storage_drift.detectors.drift_detector import StorageDrift
+
+            kwargs: dict = {}
+            if solc is not None:
+                kwargs["solc"] = solc
+            sl = Slither(os.fspath(sol_path), **kwargs)
+            sl.register_detector(StorageDrift)
+            raw = sl.run_detectors()
+            results = tuple(itertools.chain.from_iterable(raw))
+            if cache_file is not None:
+                _store_cached(cache_file, results)
+        _cache[key] = Analyzed(
+            results, drifting_vars(results), storage_drift_fields(results)
+        )
     return _cache[key]
 
 
-def drifting_vars(results: list[dict]) -> set[str]:
-    """Extract the set of drifting variable names from results."""
-    names: set[str] = set()
+def run_detector(
+    filename: str, *, solc: str | None = None
+) -> tuple[dict, ...]:
+    """Run storage-drift on a contract and return JSON results."""
+    return analyze(filename, solc=solc).raw
+
+
+def clear_caches() -> None:
+    """Drop every in-memory result cache; the disk cache is kept."""
+    _cache.clear()
+    _vars_cache.clear()
+    _fields_cache.clear()
+
+
+# Derived views keyed by id() of a results sequence.  The sequence
+# itself is kept in the entry so its id can't be reused while cached.
+_vars_cache: dict[int, tuple[Sequence[dict], frozenset[str]]] = {}
+_fields_cache: dict[int, tuple[Sequence[dict], Mapping[str, dict]]] = {}
+
+
+def drifting_vars(results: Sequence[dict]) -> frozenset[str]:
+    """Extract the set of drifting variable names from results.
+
+    The set is shared between callers, so it is frozen.
+    """
+    cached = _vars_cache.get(id(results))
+    if cached is not None and cached[0] is results:
+        return cached[1]
+    found: set[str] = set()
     for r in results:
-        elems = r.get("elements", [])
-        if elems:
-            name = elems[0].get("name", "")
-            if name:
-                names.add(name)
+        try:
+            name = r["elements"][0]["name"]
+        except (KeyError, IndexError):
+            continue
+        if name:
+            found.add(name)
+    names = frozenset(found)
+    _vars_cache[id(results)] = (results, names)
     return names
 
 
-def storage_drift_fields(
-    results: list[dict],
-) -> dict[str, dict]:
-    """Map variable canonical name to its storage_drift JSON."""
+def storage_drift_fields(results: Sequence[dict]) -> Mapping[str, dict]:
+    """Map variable canonical name to its storage_drift JSON.
+
+    The mapping is shared between callers, so it is read-only.
+    """
+    cached = _fields_cache.get(id(results))
+    if cached is not None and cached[0] is results:
+        return cached[1]
     out: dict[str, dict] = {}
     for r in results:
-        ts = r.get("additional_fields", {}).get("storage_drift", {})
-        if ts:
+        try:
+            ts = r["additional_fields"]["storage_drift"]
             out[ts["variable"]] = ts
-    return out
+        except KeyError:
+            continue
+    fields = MappingProxyType(out)
+    _fields_cache[id(results)] = (results, fields)
+    return fields
+
+
+def drift_field(results: Sequence[dict], variable: str) -> dict:
+    """Return the storage_drift JSON for *variable* (canonical name).
+
+    Agrees with storage_drift_fields: when several findings name the
+    variable, the last one wins, so the search runs backwards and
+    stops at the first hit.  Raises KeyError if no finding names it.
+    """
+    for r in reversed(results):
+        try:
+            ts = r["additional_fields"]["storage_drift"]
+            if ts["variable"] == variable:
+                return ts
+        except KeyError:
+            continue
+    raise KeyError(variable)
+
+
+def bad_slot_hex(fields: Mapping[str, dict]) -> list[str]:
+    """Return the variables whose slot_hex is malformed or does not
+    encode their slot.
+    """
+    match = SLOT_HEX.fullmatch
+    return [
+        var
+        for var, ts in fields.items()
+        if not match(ts["slot_hex"]) or int(ts["slot_hex"], 16) != ts["slot"]
+    ]
 
 
+@functools.lru_cache(maxsize=8)
 def find_solc(version: str) -> str | None:
     """Find a solc binary for a specific version.
 
     Uses solc-select's artifacts directory.  Returns the path
-    string or None if not installed.
+    string or None if not installed; both outcomes are cached.
     """
     try:
         from solc_select.constants import ARTIFACTS_DIR
@@ -9,16 +9,14 @@ from __future__ import annotations
 
 import pytest
 from helpers import (
-    drifting_vars as _drifting_vars,
-)
-from helpers import (
+    SLOT_HEX,
     find_solc,
 )
 from helpers import (
-    run_detector as _run_detector,
+    drift_field as _drift_field,
 )
 from helpers import (
-    storage_drift_fields as _drift_fields,
+    drifting_vars as _drifting_vars,
 )
 
 _SOLC_07 = find_solc("0.7.6")
@@ -30,36 +28,32 @@ _SOLC_07 = find_solc("0.7.6")
 class TestTether:
     """Tether (USDT) -- no drift sources, all writes are clean."""
 
-    @pytest.fixture(scope="class")
-    def results(self):
-        return _run_detector("tokens/tether.sol")
-
-    def test_no_findings(self, results):
+    def test_no_findings(self, tether_results):
         """Production USDT contract has zero drifting storage."""
-        assert len(results) == 0
+        assert len(tether_results) == 0
 
-    def test_clean_balances(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_balances(self, tether_results):
+        drifting = _drifting_vars(tether_results)
         assert "balances" not in drifting
 
-    def test_clean_owner(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_owner(self, tether_results):
+        drifting = _drifting_vars(tether_results)
         assert "owner" not in drifting
 
-    def test_clean_totalSupply(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_totalSupply(self, tether_results):
+        drifting = _drifting_vars(tether_results)
         assert "_totalSupply" not in drifting
 
-    def test_clean_paused(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_paused(self, tether_results):
+        drifting = _drifting_vars(tether_results)
         assert "paused" not in drifting
 
-    def test_clean_blacklist(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_blacklist(self, tether_results):
+        drifting = _drifting_vars(tether_results)
         assert "isBlackListed" not in drifting
 
-    def test_clean_fee_params(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_fee_params(self, tether_results):
+        drifting = _drifting_vars(tether_results)
         assert "basisPointsRate" not in drifting
         assert "maximumFee" not in drifting
 
@@ -71,20 +65,16 @@ class TestWETH:
     """Wrapped Ether -- address(this).balance in view function
     only; no state writes depend on drift sources."""
 
-    @pytest.fixture(scope="class")
-    def results(self):
-        return _run_detector("tokens/weth.sol")
-
-    def test_no_findings(self, results):
+    def test_no_findings(self, weth_results):
         """WETH contract has zero drifting storage."""
-        assert len(results) == 0
+        assert len(weth_results) == 0
 
-    def test_clean_balanceOf(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_balanceOf(self, weth_results):
+        drifting = _drifting_vars(weth_results)
         assert "balanceOf" not in drifting
 
-    def test_clean_allowance(self, results):
-        drifting = _drifting_vars(results)
+    def test_clean_allowance(self, weth_results):
+        drifting = _drifting_vars(weth_results)
         assert "allowance" not in drifting
 
 
@@ -101,50 +91,42 @@ _skip_no_solc07 = pytest.mark.skipif(
 class TestUniswapV3Factory:
     """UniswapV3Factory -- CREATE2 deployment taints getPool."""
 
-    @pytest.fixture(scope="class")
-    def results(self):
-        return _run_detector("uniswap-v3/UniswapV3Factory.sol", solc=_SOLC_07)
-
-    def test_getPool_tainted(self, results):
+    def test_getPool_tainted(self, uniswap_factory_results):
         """getPool mapping stores CREATE2-deployed address."""
-        drifting = _drifting_vars(results)
+        drifting = _drifting_vars(uniswap_factory_results)
         assert "getPool" in drifting
 
-    def test_getPool_source_is_create2(self, results):
-        fields = _drift_fields(results)
-        ts = fields["UniswapV3Factory.getPool"]
+    def test_getPool_source_is_create2(self, uniswap_factory_results):
+        ts = _drift_field(uniswap_factory_results, "UniswapV3Factory.getPool")
         assert ts["taint_source"] == "CREATE2"
 
-    def test_getPool_function(self, results):
-        fields = _drift_fields(results)
-        ts = fields["UniswapV3Factory.getPool"]
+    def test_getPool_function(self, uniswap_factory_results):
+        ts = _drift_field(uniswap_factory_results, "UniswapV3Factory.getPool")
         assert "createPool" in ts["function"]
 
-    def test_getPool_slot(self, results):
-        fields = _drift_fields(results)
-        ts = fields["UniswapV3Factory.getPool"]
+    def test_getPool_slot(self, uniswap_factory_results):
+        ts = _drift_field(uniswap_factory_results, "UniswapV3Factory.getPool")
         assert ts["slot"] == 5
 
-    def test_only_one_finding(self, results):
+    def test_only_one_finding(self, uniswap_factory_results):
         """Only getPool drifts, not owner or feeAmountTickSpacing."""
-        assert len(results) == 1
+        assert len(uniswap_factory_results) == 1
 
-    def test_owner_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_owner_clean(self, uniswap_factory_results):
+        drifting = _drifting_vars(uniswap_factory_results)
         assert "owner" not in drifting
 
-    def test_feeAmountTickSpacing_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_feeAmountTickSpacing_clean(self, uniswap_factory_results):
+        drifting = _drifting_vars(uniswap_factory_results)
         assert "feeAmountTickSpacing" not in drifting
 
-    def test_parameters_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_parameters_clean(self, uniswap_factory_results):
+        drifting = _drifting_vars(uniswap_factory_results)
         assert "parameters" not in drifting
 
-    def test_json_completeness(self, results):
+    def test_json_completeness(self, uniswap_factory_results):
         """JSON output includes all required fields."""
-        fields = _drift_fields(results)
-        ts = fields["UniswapV3Factory.getPool"]
+        ts = _drift_field(uniswap_factory_results, "UniswapV3Factory.getPool")
         for key in (
             "variable",
             "contract",
@@ -156,8 +138,7 @@ class TestUniswapV3Factory:
         ):
             assert key in ts, f"missing {key}"
         assert ts["contract"] == "UniswapV3Factory"
-        assert ts["slot_hex"].startswith("0x")
-        assert len(ts["slot_hex"]) == 66
+        assert SLOT_HEX.fullmatch(ts["slot_hex"])
 
 
 # ── Uniswap V3 Pool ───────────────────────────────────────────
@@ -168,39 +149,35 @@ class TestUniswapV3Pool:
     """UniswapV3Pool -- no gasleft/gasprice/basefee/CREATE2.
     block.timestamp is not a tracked drift source."""
 
-    @pytest.fixture(scope="class")
-    def results(self):
-        return _run_detector("uniswap-v3/UniswapV3Pool.sol", solc=_SOLC_07)
-
-    def test_no_findings(self, results):
+    def test_no_findings(self, uniswap_pool_results):
         """Pool has no drifting storage (block.timestamp not tracked)."""
-        assert len(results) == 0
+        assert len(uniswap_pool_results) == 0
 
-    def test_slot0_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_slot0_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "slot0" not in drifting
 
-    def test_liquidity_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_liquidity_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "liquidity" not in drifting
 
-    def test_feeGrowth_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_feeGrowth_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "feeGrowthGlobal0X128" not in drifting
         assert "feeGrowthGlobal1X128" not in drifting
 
-    def test_protocolFees_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_protocolFees_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "protocolFees" not in drifting
 
-    def test_observations_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_observations_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "observations" not in drifting
 
-    def test_ticks_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_ticks_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "ticks" not in drifting
 
-    def test_positions_clean(self, results):
-        drifting = _drifting_vars(results)
+    def test_positions_clean(self, uniswap_pool_results):
+        drifting = _drifting_vars(uniswap_pool_results)
         assert "positions" not in drifting
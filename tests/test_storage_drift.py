@@ -2,57 +2,62 @@
 
 from __future__ import annotations
 
+import pytest
 from helpers import (
-    drifting_vars as _drifting_vars,
+    bad_slot_hex as _bad_slot_hex,
+)
+from helpers import (
+    drift_field as _drift_field,
 )
 from helpers import (
-    run_detector as _run_detector,
+    drifting_vars as _drifting_vars,
 )
 from helpers import (
     storage_drift_fields as _drift_fields,
 )
 
-# ── GasleftTaint ────────────────────────────────────────────────
-
-
-def test_gasleft_direct():
-    results = _run_detector("GasleftTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "storedGas" in drifting
-
-
-def test_gasleft_arithmetic():
-    results = _run_detector("GasleftTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "gasBasedCalc" in drifting
-
-
-def test_gasleft_hashed():
-    results = _run_detector("GasleftTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "hashedGas" in drifting
-
+# Keys every storage_drift entry in additional_fields must carry.
+_REQUIRED_KEYS = frozenset(
+    (
+        "variable",
+        "contract",
+        "slot",
+        "slot_hex",
+        "offset",
+        "taint_source",
+        "function",
+    )
+)
 
-def test_gasleft_control_flow():
-    results = _run_detector("GasleftTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "conditionalStore" in drifting
+# ── GasleftTaint ────────────────────────────────────────────────
 
 
-def test_gasleft_mapping_key():
-    results = _run_detector("GasleftTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "gasMap" in drifting
+@pytest.mark.sol_file("GasleftTaint.sol")
+@pytest.mark.parametrize(
+    "var",
+    [
+        "storedGas",
+        "gasBasedCalc",
+        "hashedGas",
+        "conditionalStore",
+        "gasMap",
+    ],
+)
+def test_gasleft_drifting(detector_results, var):
+    drifting = _drifting_vars(detector_results("GasleftTaint.sol"))
+    assert var in drifting
 
 
-def test_gasleft_clean():
-    results = _run_detector("GasleftTaint.sol")
+@pytest.mark.sol_file("GasleftTaint.sol")
+def test_gasleft_clean(detector_results):
+    results = detector_results("GasleftTaint.sol")
     drifting = _drifting_vars(results)
     assert "cleanVar" not in drifting
 
 
-def test_gasleft_slots():
-    results = _run_detector("GasleftTaint.sol")
+@pytest.mark.sol_file("GasleftTaint.sol")
+def test_gasleft_slots(detector_results):
+    results = detector_results("GasleftTaint.sol")
     fields = _drift_fields(results)
     assert fields["GasleftTaint.storedGas"]["slot"] == 0
     assert fields["GasleftTaint.gasBasedCalc"]["slot"] == 1
@@ -62,64 +67,53 @@ def test_gasleft_slots():
     assert fields["GasleftTaint.gasMap"]["slot"] == 5
 
 
-def test_gasleft_json_taint_source():
-    results = _run_detector("GasleftTaint.sol")
+@pytest.mark.sol_file("GasleftTaint.sol")
+def test_gasleft_json_taint_source(detector_results):
+    results = detector_results("GasleftTaint.sol")
     fields = _drift_fields(results)
-    for var_name, ts in fields.items():
+    for ts in fields.values():
         assert ts["taint_source"] == "gasleft()"
-        assert ts["slot_hex"].startswith("0x")
-        assert len(ts["slot_hex"]) == 66  # 0x + 64 hex chars
         assert ts["contract"] == "GasleftTaint"
+    assert not _bad_slot_hex(fields)
 
 
 # ── BalanceTaint ────────────────────────────────────────────────
 
 
-def test_balance_direct():
-    results = _run_detector("BalanceTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "senderBal" in drifting
-
-
-def test_balance_arithmetic():
-    results = _run_detector("BalanceTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "balCalc" in drifting
-
-
-def test_balance_control_flow():
-    results = _run_detector("BalanceTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "controlFlowBal" in drifting
-
-
-def test_balance_mapping():
-    results = _run_detector("BalanceTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "balances" in drifting
-
-
-def test_balance_hashed():
-    results = _run_detector("BalanceTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "hashOfBalance" in drifting
+@pytest.mark.sol_file("BalanceTaint.sol")
+@pytest.mark.parametrize(
+    "var",
+    [
+        "senderBal",
+        "balCalc",
+        "controlFlowBal",
+        "balances",
+        "hashOfBalance",
+    ],
+)
+def test_balance_drifting(detector_results, var):
+    drifting = _drifting_vars(detector_results("BalanceTaint.sol"))
+    assert var in drifting
 
 
-def test_balance_clean():
-    results = _run_detector("BalanceTaint.sol")
+@pytest.mark.sol_file("BalanceTaint.sol")
+def test_balance_clean(detector_results):
+    results = detector_results("BalanceTaint.sol")
     drifting = _drifting_vars(results)
     assert "cleanAmount" not in drifting
 
 
-def test_balance_json_taint_source():
-    results = _run_detector("BalanceTaint.sol")
+@pytest.mark.sol_file("BalanceTaint.sol")
+def test_balance_json_taint_source(detector_results):
+    results = detector_results("BalanceTaint.sol")
     fields = _drift_fields(results)
     for ts in fields.values():
         assert "msg.sender.balance" in ts["taint_source"]
 
 
-def test_balance_slots():
-    results = _run_detector("BalanceTaint.sol")
+@pytest.mark.sol_file("BalanceTaint.sol")
+def test_balance_slots(detector_results):
+    results = detector_results("BalanceTaint.sol")
     fields = _drift_fields(results)
     assert fields["BalanceTaint.senderBal"]["slot"] == 0
     assert fields["BalanceTaint.balCalc"]["slot"] == 1
@@ -132,39 +126,38 @@ def test_balance_slots():
 # ── Create2Taint ────────────────────────────────────────────────
 
 
-def test_create2_direct():
-    results = _run_detector("Create2Taint.sol")
-    drifting = _drifting_vars(results)
-    assert "deployedAddr" in drifting
-
-
-def test_create2_cast():
-    results = _run_detector("Create2Taint.sol")
-    drifting = _drifting_vars(results)
-    assert "derivedFromAddr" in drifting
-
-
-def test_create2_balance():
-    results = _run_detector("Create2Taint.sol")
-    drifting = _drifting_vars(results)
-    assert "addrBalance" in drifting
+@pytest.mark.sol_file("Create2Taint.sol")
+@pytest.mark.parametrize(
+    "var",
+    [
+        "deployedAddr",
+        "derivedFromAddr",
+        "addrBalance",
+    ],
+)
+def test_create2_drifting(detector_results, var):
+    drifting = _drifting_vars(detector_results("Create2Taint.sol"))
+    assert var in drifting
 
 
-def test_create2_no_salt_clean():
-    results = _run_detector("Create2Taint.sol")
+@pytest.mark.sol_file("Create2Taint.sol")
+def test_create2_no_salt_clean(detector_results):
+    results = detector_results("Create2Taint.sol")
     drifting = _drifting_vars(results)
     assert "cleanDeployed" not in drifting
 
 
-def test_create2_json_taint_source():
-    results = _run_detector("Create2Taint.sol")
+@pytest.mark.sol_file("Create2Taint.sol")
+def test_create2_json_taint_source(detector_results):
+    results = detector_results("Create2Taint.sol")
     fields = _drift_fields(results)
     for ts in fields.values():
         assert "CREATE2" in ts["taint_source"]
 
 
-def test_create2_slots():
-    results = _run_detector("Create2Taint.sol")
+@pytest.mark.sol_file("Create2Taint.sol")
+def test_create2_slots(detector_results):
+    results = detector_results("Create2Taint.sol")
     fields = _drift_fields(results)
     assert fields["Create2Taint.deployedAddr"]["slot"] == 0
     assert fields["Create2Taint.derivedFromAddr"]["slot"] == 1
@@ -175,26 +168,29 @@ def test_create2_slots():
 # ── CrossFunction ───────────────────────────────────────────────
 
 
-def test_cross_function_internal_call():
-    results = _run_detector("CrossFunction.sol")
-    drifting = _drifting_vars(results)
-    assert "storedResult" in drifting
-
-
-def test_cross_function_multi_hop():
-    results = _run_detector("CrossFunction.sol")
-    drifting = _drifting_vars(results)
-    assert "indirectResult" in drifting
+@pytest.mark.sol_file("CrossFunction.sol")
+@pytest.mark.parametrize(
+    "var",
+    [
+        "storedResult",
+        "indirectResult",
+    ],
+)
+def test_cross_function_drifting(detector_results, var):
+    drifting = _drifting_vars(detector_results("CrossFunction.sol"))
+    assert var in drifting
 
 
-def test_cross_function_clean():
-    results = _run_detector("CrossFunction.sol")
+@pytest.mark.sol_file("CrossFunction.sol")
+def test_cross_function_clean(detector_results):
+    results = detector_results("CrossFunction.sol")
     drifting = _drifting_vars(results)
     assert "cleanResult" not in drifting
 
 
-def test_cross_function_json():
-    results = _run_detector("CrossFunction.sol")
+@pytest.mark.sol_file("CrossFunction.sol")
+def test_cross_function_json(detector_results):
+    results = detector_results("CrossFunction.sol")
     fields = _drift_fields(results)
     assert fields["CrossFunction.storedResult"]["slot"] == 0
     assert fields["CrossFunction.indirectResult"]["slot"] == 1
@@ -205,40 +201,32 @@ def test_cross_function_json():
 # ── MixedTaint ──────────────────────────────────────────────────
 
 
-def test_mixed_combined_sources():
-    results = _run_detector("MixedTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "combined" in drifting
-
-
-def test_mixed_bitwise():
-    results = _run_detector("MixedTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "bitwiseTaint" in drifting
-
-
-def test_mixed_abi_encode():
-    results = _run_detector("MixedTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "abiEncodeTaint" in drifting
-
-
-def test_mixed_nested_branch():
-    results = _run_detector("MixedTaint.sol")
-    drifting = _drifting_vars(results)
-    assert "nestedBranch" in drifting
+@pytest.mark.sol_file("MixedTaint.sol")
+@pytest.mark.parametrize(
+    "var",
+    [
+        "combined",
+        "bitwiseTaint",
+        "abiEncodeTaint",
+        "nestedBranch",
+    ],
+)
+def test_mixed_drifting(detector_results, var):
+    drifting = _drifting_vars(detector_results("MixedTaint.sol"))
+    assert var in drifting
 
 
-def test_mixed_clean():
-    results = _run_detector("MixedTaint.sol")
+@pytest.mark.sol_file("MixedTaint.sol")
+def test_mixed_clean(detector_results):
+    results = detector_results("MixedTaint.sol")
     drifting = _drifting_vars(results)
     assert "cleanAddr" not in drifting
 
 
-def test_mixed_combined_json():
-    results = _run_detector("MixedTaint.sol")
-    fields = _drift_fields(results)
-    src = fields["MixedTaint.combined"]["taint_source"]
+@pytest.mark.sol_file("MixedTaint.sol")
+def test_mixed_combined_json(detector_results):
+    results = detector_results("MixedTaint.sol")
+    src = _drift_field(results, "MixedTaint.combined")["taint_source"]
     assert "gasleft()" in src
     assert "msg.sender.balance" in src
 
@@ -246,62 +234,35 @@ def test_mixed_combined_json():
 # ── EdgeCases ───────────────────────────────────────────────────
 
 
-def test_edge_no_false_positives():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    for clean_var in [
-        "blockNum",
-        "timestamp",
-        "msgValue",
-        "otherBalance",
-    ]:
-        assert clean_var not in drifting, f"{clean_var} should not drift"
-
-
-def test_edge_gas_in_loop():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "gasInLoop" in drifting
-
-
-def test_edge_ternary():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "ternaryGas" in drifting
-
-
-def test_edge_multi_assign():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "multiAssign" in drifting
-
-
-def test_edge_tx_gasprice():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "txGasPrice" in drifting
-
-
-def test_edge_block_basefee():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "baseFee" in drifting
-
-
-def test_edge_block_blobbasefee():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "blobBaseFee" in drifting
-
-
-def test_edge_block_gaslimit():
-    results = _run_detector("EdgeCases.sol")
-    drifting = _drifting_vars(results)
-    assert "gasLimit" in drifting
+@pytest.mark.sol_file("EdgeCases.sol")
+def test_edge_no_false_positives(detector_results):
+    results = detector_results("EdgeCases.sol")
+    clean = frozenset(("blockNum", "timestamp", "msgValue", "otherBalance"))
+    leaked = clean & _drifting_vars(results)
+    assert not leaked, f"unexpected drift: {sorted(leaked)}"
+
+
+@pytest.mark.sol_file("EdgeCases.sol")
+@pytest.mark.parametrize(
+    "var",
+    [
+        "gasInLoop",
+        "ternaryGas",
+        "multiAssign",
+        "txGasPrice",
+        "baseFee",
+        "blobBaseFee",
+        "gasLimit",
+    ],
+)
+def test_edge_drifting(detector_results, var):
+    drifting = _drifting_vars(detector_results("EdgeCases.sol"))
+    assert var in drifting
 
 
-def test_edge_gas_sources_reasons():
-    results = _run_detector("EdgeCases.sol")
+@pytest.mark.sol_file("EdgeCases.sol")
+def test_edge_gas_sources_reasons(detector_results):
+    results = detector_results("EdgeCases.sol")
     fields = _drift_fields(results)
     assert fields["EdgeCases.txGasPrice"]["taint_source"] == ("tx.gasprice")
     assert fields["EdgeCases.baseFee"]["taint_source"] == ("block.basefee")
@@ -313,17 +274,19 @@ def test_edge_gas_sources_reasons():
 # ── PackedStorage (slot packing + offset) ───────────────────────
 
 
-def test_packed_tainted_vars():
-    results = _run_detector("PackedStorage.sol")
+@pytest.mark.sol_file("PackedStorage.sol")
+def test_packed_tainted_vars(detector_results):
+    results = detector_results("PackedStorage.sol")
     drifting = _drifting_vars(results)
-    for var in ["b", "d", "f", "h", "m"]:
-        assert var in drifting, f"{var} should drift"
-    for var in ["a", "c", "e", "g"]:
-        assert var not in drifting, f"{var} should NOT drift"
+    missing = frozenset(("b", "d", "f", "h", "m")) - drifting
+    assert not missing, f"should drift: {sorted(missing)}"
+    leaked = frozenset(("a", "c", "e", "g")) & drifting
+    assert not leaked, f"should NOT drift: {sorted(leaked)}"
 
 
-def test_packed_slot_offsets():
-    results = _run_detector("PackedStorage.sol")
+@pytest.mark.sol_file("PackedStorage.sol")
+def test_packed_slot_offsets(detector_results):
+    results = detector_results("PackedStorage.sol")
     fields = _drift_fields(results)
 
     b = fields["PackedStorage.b"]
@@ -347,38 +310,33 @@ def test_packed_slot_offsets():
     assert m["offset"] == 0
 
 
-def test_packed_slot_hex_format():
-    results = _run_detector("PackedStorage.sol")
+@pytest.mark.sol_file("PackedStorage.sol")
+def test_packed_slot_hex_format(detector_results):
+    results = detector_results("PackedStorage.sol")
     fields = _drift_fields(results)
-    for ts in fields.values():
-        slot_hex = ts["slot_hex"]
-        assert slot_hex.startswith("0x")
-        assert len(slot_hex) == 66
-        assert int(slot_hex, 16) == ts["slot"]
+    bad = _bad_slot_hex(fields)
+    assert not bad, f"bad slot_hex: {bad}"
 
 
-def test_packed_json_completeness():
+@pytest.mark.sol_file("PackedStorage.sol")
+def test_packed_json_completeness(detector_results):
     """Every result has all required storage_drift fields."""
-    results = _run_detector("PackedStorage.sol")
-    required_keys = {
-        "variable",
-        "contract",
-        "slot",
-        "slot_hex",
-        "offset",
-        "taint_source",
-        "function",
-    }
-    for r in results:
-        ts = r.get("additional_fields", {}).get("storage_drift", {})
-        assert ts, "missing storage_drift in additional_fields"
-        assert required_keys <= set(ts.keys()), (
-            f"missing keys: {required_keys - set(ts.keys())}"
-        )
-
-
-def test_packed_taint_sources():
-    results = _run_detector("PackedStorage.sol")
+    results = detector_results("PackedStorage.sol")
+    # A result without storage_drift misses every required key.
+    entries = (
+        r.get("additional_fields", {}).get("storage_drift", {})
+        for r in results
+    )
+    missing = next(
+        (keys for ts in entries if (keys := _REQUIRED_KEYS - ts.keys())),
+        None,
+    )
+    assert missing is None, f"missing keys: {sorted(missing)}"
+
+
+@pytest.mark.sol_file("PackedStorage.sol")
+def test_packed_taint_sources(detector_results):
+    results = detector_results("PackedStorage.sol")
     fields = _drift_fields(results)
     assert fields["PackedStorage.b"]["taint_source"] == "gasleft()"
     assert "msg.sender.balance" in (fields["PackedStorage.d"]["taint_source"])